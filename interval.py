@@ -15,15 +15,25 @@ from __future__ import annotations
 """              modes and scales.                                                   """
 """                                                                                  """
 """ Exported classes:                                                                """
-"""     AbstractInterval, Interval                                                   """
+"""     AbstractInterval, Interval, IntervalArray                                    """
 """                                                                                  """
 """ Exported constants:                                                              """
-"""     INTERVALS(dict)                                                              """
+"""     INTERVALS(MappingProxyType), SIZE_TO_NAMES(dict)                             """
+"""                                                                                  """
+""" Performance notes:                                                               """
+"""     Interval work here is bound by interpreter overhead (parsing, dict probes,   """
+"""     allocation), not arithmetic, so threads or SIMD would not pay off. Intervals """
+"""     are interned integer codes with slotted, precomputed properties, and         """
+"""     evaluation goes through lookup tables; keep new hot paths on those tables.   """
 
-from typing import Union
+from typing import Union, List, Sequence, TYPE_CHECKING
 from enum import Enum
-import pitch
+from types import MappingProxyType
+from array import array
+from functools import lru_cache
 import utils
+if(TYPE_CHECKING): # Only used in annotations
+    import pitch
 
 # Interval qualities constant defination
 class INTERVAL_QUALITIES(Enum):
@@ -33,8 +43,8 @@ class INTERVAL_QUALITIES(Enum):
     M = 1 # major
     A = 2 # augmented
 
-# Interval names constant defination
-INTERVALS = {
+# Interval names constant defination, read-only since the tables below are derived from it
+INTERVALS = MappingProxyType({
     'P1': 0, # Perfect 1st, Unison
     'm2': 1, # Minor 2nd, the follows are the same
     'A1': 1, # Augmented 1st, the follows are the same
@@ -58,12 +68,69 @@ INTERVALS = {
     'A6': 10,
     'M7': 11,
     'P8': 12
-}
+})
+
+# Interval names indexed by interval size, built once from "INTERVALS"
+SIZE_TO_NAMES = {_size: tuple(_names) for _size, _names in utils.reverse_dict(INTERVALS).items()}
+
+# Interval quality names indexed by "quality value + 2"
+_QUALITY_NAMES = tuple(quality.name for quality in INTERVAL_QUALITIES)
+_QUALITY_SET = frozenset(_QUALITY_NAMES)
+
+# Intervals are stored as a code "(quality value + 2) << 6 | degree",
+# names and sizes of all valid codes are precomputed here, None for invalid codes.
+# "_NAME_INFO" resolves every valid interval name to (quality, degree, code).
+_NAME_TABLE = [None] * (len(_QUALITY_NAMES) << 6)
+_SIZE_TABLE = [None] * (len(_QUALITY_NAMES) << 6)
+_NAME_INFO = {}
+for _quality in INTERVAL_QUALITIES:
+    for _degree in range(1, 53):
+        _singleName = f"{_quality.name}{(_degree - 1) % 7 + 1}"
+        if(_singleName in INTERVALS):
+            _code = (_quality.value + 2) << 6 | _degree
+            _NAME_TABLE[_code] = f"{_quality.name}{_degree}"
+            _SIZE_TABLE[_code] = INTERVALS[_singleName] + (_degree - 1) // 7 * 12
+            _NAME_INFO[_NAME_TABLE[_code]] = (_quality.name, _degree, _code)
+
+# Codes of the inversions indexed by code, mirroring the quality around "P" and the degree
+# of the simple interval as "9 - simple degree", keeping octaves. None if the inversion is not a valid interval.
+_INVERT_TABLE = [None] * len(_NAME_TABLE)
+for _name, (_quality, _degree, _code) in _NAME_INFO.items():
+    _invertedCode = (4 - (_code >> 6)) << 6 | (9 - (_degree % 7 or 7) + (_degree - 1) // 7 * 7)
+    if(_invertedCode < len(_NAME_TABLE) and _NAME_TABLE[_invertedCode] is not None):
+        _INVERT_TABLE[_code] = _invertedCode
+
+# Codes of the prior simple interval of each size, natural intervals are prior
+_SIZE_TO_CODE = tuple(_NAME_INFO[SIZE_TO_NAMES[_size][0]][2] for _size in range(12))
+
+# Codes of simple intervals indexed by [interval size % 12][degree size - 1], as evaluated by "AbstractInterval.eval"
+_SEMITONE_DEGREE_TO_CODE = tuple(
+    tuple(
+        next((_NAME_INFO[_name][2] for _name in SIZE_TO_NAMES[_size] if int(_name[-1]) == _degree),
+             _SIZE_TO_CODE[_size]) # Enharmonic if no found
+        for _degree in range(1, 8))
+    for _size in range(12))
+
+
+def _eval_code(rootNumber: int, rootDegree: int, topNumber: int, topDegree: int) -> int:
+    """
+    Evaluate the code of the simple interval between two pitches given by pitch numbers and scale degrees.
+    Integer operations only, used by "IntervalArray.eval"; "_eval_cached" indexes the same table by the reduced sizes.
+    """
+    # Python modulo is non-negative, so the sizes wrap to 0-11 and 0-6 without branches.
+    return _SEMITONE_DEGREE_TO_CODE[(topNumber - rootNumber) % 12][(topDegree - rootDegree) % 7]
+
+
+@lru_cache(maxsize=None) # Keyed on the reduced sizes, at most 12 * 7 keys
+def _eval_cached(intervalSize: int, degreeSize: int) -> AbstractInterval:
+    # Interval of a semitone size 0-11 and a degree size 0-6, callers reduce with "% 12" and "% 7"
+    return AbstractInterval._from_code(_SEMITONE_DEGREE_TO_CODE[intervalSize][degreeSize])
 
 
 class AbstractInterval:
     """
     Describes intervals without specific pitchs with octaves.
+    Instances are immutable and interned, constructing the same interval twice returns the same instance.
 
     Properties:
         name: Name of the interval.
@@ -72,16 +139,30 @@ class AbstractInterval:
     Methods:
         __init__(self, interval: Constructor of the class.
         __repr__(self): Representer of the class.
-        set(self, interval): Set interval of this instance with interval name or interval size.
         invert(self): Evaluate inversion of this interval instance.
 
     Static Methods:
         eval(rootPitch, topPitch): Evaluate interval between root pitch and top pitch.
+        eval_batch(rootNumbers, rootDegrees, topNumbers, topDegrees): Evaluate intervals between many pairs of pitches at once.
         eval_min(pitch1, pitch2): Evaluate minimal interval between two pitches. The position of pitches may be inverted.
     """
 
-    __quality = "P"
-    __degree = 1
+    __slots__ = ('_code', '_name', '_quality', '_degree', '_octave',
+                 '_singleName', '_singleSize', '_singleDegree', '_size')
+    __interned = {} # Interned instances keyed by (class, code)
+
+    def __new__(cls, interval: Union[int, str]) -> AbstractInterval:
+        return cls._from_code(AbstractInterval.__code_of(interval))
+
+    @classmethod
+    def _from_code(cls, code: int) -> AbstractInterval:
+        # Trusted constructor for valid codes computed by this module, skips resolving and validation.
+        instance = AbstractInterval.__interned.get((cls, code))
+        if(instance is None):
+            instance = super(AbstractInterval, cls).__new__(cls)
+            instance.__set_code(code)
+            AbstractInterval.__interned[(cls, code)] = instance
+        return instance
 
     def __init__(self, interval: Union[int, str]) -> None:
         """
@@ -94,30 +175,40 @@ class AbstractInterval:
         Return:
             instance[AbstractInterval]: The interval instance according to the arguments.
         """
-        self.set(interval)
+        pass # Resolved and interned in "__new__"
 
     def __str__(self):
-        return "{}{}".format(self.__quality, self.__degree)
+        return self._name
 
     def __repr__(self):
-        return "intervalName: {}, intervalSize: {}".format(str(self), self.size)
-
-    def set(self, interval: Union[int, str]) -> None:
-        """
-        Set interval of this instance with interval name or interval size.
+        return f"intervalName: {self._name}, intervalSize: {self._size}"
+
+    def __reduce__(self):
+        return (self.__class__, (self.name,))
+
+    def __set_code(self, code: int) -> None:
+        # Derive every property once, instances are read far more often than created
+        degree = code & 63
+        octave = (degree - 1) // 7
+        self._code = code
+        self._name = _NAME_TABLE[code]
+        self._quality = _QUALITY_NAMES[code >> 6]
+        self._degree = degree
+        self._octave = octave
+        self._singleName = _NAME_TABLE[code - octave * 7]
+        self._singleSize = _SIZE_TABLE[code - octave * 7]
+        self._singleDegree = degree % 7
+        self._size = _SIZE_TABLE[code]
 
-        Arguments:
-            interval[int: 0-88]: The semitone number of the interval. Natural or diminished intervals are prior if using int as argument.
-            or interval[str]: The interval name. Format is as the dictionary "INTERVALS". Using this as argument is recommend.
-        """
+    @staticmethod
+    def __code_of(interval: Union[int, str]) -> int:
         if(isinstance(interval, str)):
-            interval = AbstractInterval.res_name(interval)
-            self.__quality = interval[0]
-            self.__degree = interval[1]
-        elif(isinstance(interval, int) and 0 < interval < 88):
-            singleIntervalName = utils.search_dict_by_value(INTERVALS, interval % 12)[0] # Natural intervals are prior
-            self.__quality = singleIntervalName[0]
-            self.__degree = interval // 12 * 7 + int(singleIntervalName[1])
+            info = _NAME_INFO.get(interval)
+            if(info is None):
+                AbstractInterval.res_name(interval) # Raises the error describing what is wrong
+            return info[2]
+        elif(type(interval) is int and 0 < interval < 88): # Exact check, also keeps bool out
+            return _SIZE_TO_CODE[interval % 12] + interval // 12 * 7
         else:
             raise TypeError('"interval" must be a integer between 0 and 88 or as format of members in the dictionary "INTERVALS".')
 
@@ -132,21 +223,26 @@ class AbstractInterval:
             i = AbstractInterval("A4")
             print(i.invert()) # Prints "d5"
         """
-
-        return AbstractInterval(INTERVAL_QUALITIES(-INTERVAL_QUALITIES[self.quality].value).name +
-                                str(9 - int(self.singleDegree) + self.octave * 7))
+        invertedCode = _INVERT_TABLE[self._code]
+        if(invertedCode is None):
+            raise ValueError(f'Inversion of "{self._name}" is not a valid interval.')
+        return AbstractInterval._from_code(invertedCode)
 
     @staticmethod
     def res_name(intervalName: str) -> tuple:
-        if(intervalName[0] in INTERVAL_QUALITIES.__members__):
-            quality = intervalName[0]
-        else:
+        info = _NAME_INFO.get(intervalName)
+        if(info is not None):
+            return (info[0], info[1])
+
+        # Find out what is wrong with the name
+        if(intervalName[:1] not in _QUALITY_SET):
             raise ValueError("Interval quality must be M, m, P, A, d(major, minor, perfect, augmented, diminished).")
-        if(1 <= int(intervalName[1:]) <= 52):
-            degree = int(intervalName[1:])
-        else:
+        degree = int(intervalName[1:]) if intervalName[1:].isdigit() else 0
+        if(not(1 <= degree <= 52)):
             raise ValueError("Interval degree must between 1 and 52.")
-        return (quality, degree)
+        if(intervalName[1:] != str(degree)):
+            raise ValueError(f'Interval degree "{intervalName[1:]}" is malformed, write it as {degree}.')
+        raise ValueError(f'Interval quality "{intervalName[0]}" is not applicable to degree {degree}.')
 
     @staticmethod
     def eval(rootPitch: Union[pitch.GenericPitch, pitch.Pitch], topPitch: Union[pitch.GenericPitch, pitch.Pitch]) -> AbstractInterval:
@@ -166,22 +262,30 @@ class AbstractInterval:
             tp = GenericPitch("E")
             i = AbstractInterval.eval(rp, tp) # Prints "M7"
         """
-        intervalSize = topPitch.number - rootPitch.number
-        degreeSize = topPitch.scaleDegree - rootPitch.scaleDegree
+        return _eval_cached((topPitch.number - rootPitch.number) % 12,
+                            (topPitch.scaleDegree - rootPitch.scaleDegree) % 7) # TODO(Luo Zhong-qi): Support Pitch class.
 
-        intervalSize = intervalSize if (intervalSize >= 0) else (intervalSize + 12) # Interval size should be a positive value.
-        degreeSize = degreeSize + 1 if (degreeSize >= 0) else (degreeSize + 8)
-        singleDegreeSize = utils.constrain_by_cycle(degreeSize, 1, 7) # Interval size should also be a positive value.
-        singleIntervalSize = intervalSize % 12
+    @staticmethod
+    def eval_batch(rootNumbers: Sequence[int], rootDegrees: Sequence[int],
+                   topNumbers: Sequence[int], topDegrees: Sequence[int]) -> List[AbstractInterval]:
+        """
+        Evaluate intervals between many pairs of root pitch and top pitch at once, same as calling "eval" on each pair.
+
+        Arguments:
+            rootNumbers[Sequence[int]]: The numbers of the root pitches, as "GenericPitch.number".
+            rootDegrees[Sequence[int]]: The scale degrees of the root pitches, as "GenericPitch.scaleDegree".
+            topNumbers[Sequence[int]]: The numbers of the top pitches.
+            topDegrees[Sequence[int]]: The scale degrees of the top pitches.
 
-        singleIntervalNames = utils.search_dict_by_value(INTERVALS, singleIntervalSize) # Find possible interval names.
-        # Find the unique interval name.
-        for singleIntervalName in singleIntervalNames:
-            if(int(singleIntervalName[-1]) == singleDegreeSize):
-                return AbstractInterval("{}{}".format(singleIntervalName[0], degreeSize))
+        Return:
+            intervals[List[AbstractInterval]]: The intervals constructed by each pair of root pitch and top pitch.
 
-        # Enharmonic if no found
-        return AbstractInterval(singleIntervalNames[0]) # TODO(Luo Zhong-qi): Support Pitch class.
+        Example:
+            i = AbstractInterval.eval_batch([5, 0], [4, 1], [4, 7], [3, 5]) # F-E, C-G
+            print([str(x) for x in i]) # Prints "['M7', 'P5']"
+        """
+        return [_eval_cached((topNumber - rootNumber) % 12, (topDegree - rootDegree) % 7)
+                for rootNumber, rootDegree, topNumber, topDegree in zip(rootNumbers, rootDegrees, topNumbers, topDegrees)]
 
     @staticmethod
     def eval_min(pitch1: pitch.GenericPitch, pitch2: pitch.GenericPitch) -> AbstractInterval:
@@ -200,43 +304,45 @@ class AbstractInterval:
             p2 = GenericPitch("E")
             i = AbstractInterval.eval_min(p1, p2) # Prints "m2"
         """
-        if (abs(pitch1.number - pitch2.number) <
-            abs(pitch2.number - pitch1.number)):
-            return AbstractInterval.eval(pitch1, pitch2)
+        number1 = pitch1.number
+        number2 = pitch2.number
+        intervalSize = (number2 - number1) % 12
+        if(intervalSize <= 6): # Ascending from pitch1 is not larger
+            return _eval_cached(intervalSize, (pitch2.scaleDegree - pitch1.scaleDegree) % 7)
         else:
-            return AbstractInterval.eval(pitch2, pitch1)
+            return _eval_cached(12 - intervalSize, (pitch1.scaleDegree - pitch2.scaleDegree) % 7)
 
     @property
     def name(self):
-        return self.__name
+        return self._name
 
     @property
     def quality(self):
-        return self.__quality
+        return self._quality
 
     @property
     def degree(self):
-        return self.__degree
+        return self._degree
 
     @property
     def octave(self):
-        return (self.degree - 1) // 7
+        return self._octave
 
     @property
     def singleName(self):
-        return "{}{}".format(self.quality, utils.constrain_by_cycle(self.degree, 1, 7))
+        return self._singleName
 
     @property
     def singleSize(self):
-        return INTERVALS[self.singleName]
+        return self._singleSize
 
     @property
     def singleDegree(self):
-        return self.degree % 7
+        return self._singleDegree
 
     @property
     def size(self):
-        return INTERVALS[self.singleName] + self.octave * 12
+        return self._size
 
 
 class Interval(AbstractInterval):
@@ -253,11 +359,131 @@ class Interval(AbstractInterval):
     Methods:
         __init__(self, interval: Constructor of the class.
         __repr__(self): Representer of the class.
-        set(self, interval): Set interval of this instance with interval name or interval size.
         invert(self, interval): Evaluate inversion of this interval instance.
 
     Static Methods:
         eval(rootPitch, topPitch): Evaluate interval between root pitch and top pitch.
         eval_min(pitch1, pitch2): Evaluate minimal interval between two pitches. The position of pitches may be shifted.
     """
-    pass #TODO(Luo Zhong-qi): Waiting for realize...
\ No newline at end of file
+    __slots__ = ()
+    #TODO(Luo Zhong-qi): Waiting for realize...
+
+
+class IntervalArray:
+    """
+    Describes a sequence of intervals as parallel arrays of qualities and degrees (structure of arrays).
+
+    Properties:
+        quality: array of int8, quality values of the intervals, defined by Enum "INTERVAL_QUALITIES".
+        degree: array of int8, degrees of the intervals.
+
+    Methods:
+        __init__(self, n): Constructor of the class, n intervals of "P1".
+        __len__(self): Number of intervals.
+        __getitem__(self, index): The interval at index as an "AbstractInterval" instance, or a slice as an "IntervalArray".
+        invert(self): Evaluate inversions of all intervals.
+        sizes(self): Evaluate sizes of all intervals.
+
+    Static Methods:
+        from_names(names): Construct an array from interval names.
+        eval(rootNumbers, rootDegrees, topNumbers, topDegrees): Evaluate intervals between many pairs of pitches into an array.
+
+    Example:
+        a = IntervalArray.from_names(["M3", "P5", "m10"])
+        print(a.sizes()) # Prints "[4, 7, 15]"
+        print(str(a.invert()[0])) # Prints "m6"
+    """
+
+    __slots__ = ('quality', 'degree')
+
+    def __init__(self, n: int) -> None:
+        self.quality = array('b', bytes(n))
+        self.degree = array('b', [1]) * n
+
+    def __len__(self):
+        return len(self.degree)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AbstractInterval, IntervalArray]:
+        if(isinstance(index, slice)):
+            sliced = IntervalArray(0)
+            sliced.quality = self.quality[index]
+            sliced.degree = self.degree[index]
+            return sliced
+        return AbstractInterval._from_code(self._code_at(index))
+
+    def _code_at(self, index: int) -> int:
+        # Code of the interval at index, checked since "quality" and "degree" are public arrays
+        quality = self.quality[index]
+        degree = self.degree[index]
+        if(not(-2 <= quality <= 2 and 1 <= degree <= 52) or _NAME_TABLE[(quality + 2) << 6 | degree] is None):
+            raise ValueError(f"Quality {quality} and degree {degree} at index {index} do not form a valid interval.")
+        return (quality + 2) << 6 | degree
+
+    @staticmethod
+    def from_names(names: Sequence[str]) -> IntervalArray:
+        """
+        Construct an array from interval names.
+
+        Arguments:
+            names[Sequence[str]]: The interval names, as format of members in the dictionary "INTERVALS".
+
+        Return:
+            instance[IntervalArray]: The array of the intervals.
+        """
+        intervals = IntervalArray(0)
+        for name in names:
+            info = _NAME_INFO.get(name)
+            if(info is None):
+                AbstractInterval.res_name(name) # Raises the error describing what is wrong
+            intervals.quality.append((info[2] >> 6) - 2)
+            intervals.degree.append(info[1])
+        return intervals
+
+    @staticmethod
+    def eval(rootNumbers: Sequence[int], rootDegrees: Sequence[int],
+             topNumbers: Sequence[int], topDegrees: Sequence[int]) -> IntervalArray:
+        """
+        Evaluate intervals between many pairs of root pitch and top pitch, as "AbstractInterval.eval_batch",
+        but into an array of qualities and degrees without constructing interval instances.
+
+        Arguments:
+            rootNumbers[Sequence[int]]: The numbers of the root pitches, as "GenericPitch.number".
+            rootDegrees[Sequence[int]]: The scale degrees of the root pitches, as "GenericPitch.scaleDegree".
+            topNumbers[Sequence[int]]: The numbers of the top pitches.
+            topDegrees[Sequence[int]]: The scale degrees of the top pitches.
+
+        Return:
+            instance[IntervalArray]: The intervals constructed by each pair of root pitch and top pitch.
+        """
+        codes = [_eval_code(rootNumber, rootDegree, topNumber, topDegree)
+                 for rootNumber, rootDegree, topNumber, topDegree in zip(rootNumbers, rootDegrees, topNumbers, topDegrees)]
+        intervals = IntervalArray(0)
+        intervals.quality = array('b', [(code >> 6) - 2 for code in codes])
+        intervals.degree = array('b', [code & 63 for code in codes])
+        return intervals
+
+    def invert(self) -> IntervalArray:
+        """
+        Evaluate inversions of all intervals, as "AbstractInterval.invert".
+
+        Return:
+            instance[IntervalArray]: The inversions of the intervals.
+        """
+        inverted = IntervalArray(0)
+        for index in range(len(self)):
+            code = self._code_at(index)
+            invertedCode = _INVERT_TABLE[code]
+            if(invertedCode is None):
+                raise ValueError(f'Inversion of "{_NAME_TABLE[code]}" is not a valid interval.')
+            inverted.quality.append((invertedCode >> 6) - 2)
+            inverted.degree.append(invertedCode & 63)
+        return inverted
+
+    def sizes(self) -> List[int]:
+        """
+        Evaluate sizes of all intervals.
+
+        Return:
+            sizes[List[int]]: The semitone numbers of the intervals.
+        """
+        return [_SIZE_TABLE[self._code_at(index)] for index in range(len(self))]
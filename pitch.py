@@ -18,12 +18,15 @@ from __future__ import annotations
 """     NATURAL_PITCHES(Enum), ACCIDENTALS(Enum), GenericPitch, Pitch                """
 """                                                                                  """
 """ Exported Constants:                                                              """
-"""     PITCHES(dict)                                                                """
+"""     PITCHES(MappingProxyType)                                                    """
 
 from enum import Enum
-from typing import Union, List
-import utils
+from types import MappingProxyType
+from typing import Union, Tuple, Sequence
+from functools import lru_cache
+from array import array
 import interval
+import utils
 
 # Pitch names constant defination
 class NATURAL_PITCHES(Enum):
@@ -56,18 +59,20 @@ class ACCIDENTALS(Enum):
     ds = 2 # Double Sharp
 
 
-# Pitch names constant defination
-PITCHES = {
+# Pitch names constant defination, read-only since the tables below are derived from it
+PITCHES = MappingProxyType({
     'C': 0,
     'Bs': 0, # B Sharp, "s" for sharp, the follows are the same
     'Ddf': 0, # D Double Flat, "ds" for double flat, the follows are the same
     'Cs': 1,
     'Df': 1, # D Flat, "f" for flat, the follows are the same
+    'Bds': 1,
     'D': 2,
     'Cds': 2,
     'Edf': 2,
     'Ds': 3,
     'Ef': 3,
+    'Fdf': 3,
     'E': 4,
     'Dds': 4,
     'Ff': 4,
@@ -76,6 +81,7 @@ PITCHES = {
     'Gdf': 5,
     'Fs': 6,
     'Gf': 6,
+    'Eds': 6,
     'G': 7,
     'Fds': 7,
     'Adf': 7,
@@ -83,13 +89,85 @@ PITCHES = {
     'Af': 8,
     'A': 9,
     'Gds': 9,
-    'Bds': 9,
+    'Bdf': 9,
     'As': 10,
     'Bf': 10,
+    'Cdf': 10,
     'B': 11,
     'Ads': 11,
     'Cf': 11
-}
+})
+
+# Plain dict copies of the Enum values, used in hot paths
+_PITCH_NUM = {natural.name: natural.value for natural in NATURAL_PITCHES}
+_ACC_NUM = {accidental.name: accidental.value for accidental in ACCIDENTALS}
+_ACC_BY_NUM = {value: name for name, value in _ACC_NUM.items()}
+_NATURAL = _ACC_BY_NUM[0]
+
+# Accidental names by the suffix of a pitch name, no suffix means natural
+_ACC_SUFFIX = dict({'': _NATURAL}, **{name: name for name in _ACC_NUM})
+
+# Natural pitches indexed by letter "C-B" = 0-6, and accidental names indexed by "accidental value + 2"
+_LETTER_NAMES = tuple(natural.name for natural in NATURAL_PITCHES)
+_LETTER_NUMS = tuple(natural.value for natural in NATURAL_PITCHES)
+_LETTER_INDEX = {name: index for index, name in enumerate(_LETTER_NAMES)}
+_ACC_NAMES = tuple(accidental.name for accidental in ACCIDENTALS)
+
+# Spelled pitch names indexed by [letter][accidental value + 2], naturals are spelled without accidental
+_SPELLINGS = tuple(tuple(name if accidental == _NATURAL else name + accidental for accidental in _ACC_NAMES)
+                   for name in _LETTER_NAMES)
+
+# Pitch names indexed by pitch number: all names as in "PITCHES", and the prior name (natural, otherwise flat)
+# with its letter index and accidental value
+_NAMES_BY_NUM = tuple(tuple(names) for num, names in sorted(utils.reverse_dict(PITCHES).items()))
+_CODES_BY_NUM = tuple((_LETTER_NUMS.index(num), 0) if num in _LETTER_NUMS else (_LETTER_NUMS.index(num + 1), -1)
+                      for num in range(12))
+_NAME_BY_NUM = tuple(_SPELLINGS[letter][accidental + 2] for letter, accidental in _CODES_BY_NUM)
+
+# Pitch numbers indexed by resolved name, as returned by "GenericPitch.res_name"
+_NUM_BY_RESOLVED = {(name, accidental): (number + value) % 12
+                    for name, number in _PITCH_NUM.items() for accidental, value in _ACC_NUM.items()}
+
+
+def _shift_kernel(number: int, letter: int, intervalSize: int, degree: int, direction: int) -> tuple:
+    """
+    Integer part of "GenericPitch.shift", works on pitch numbers and letter indexes only.
+
+    Return:
+        shifted[tuple]: (number, letter, accidental) of the shifted pitch.
+            The accidental is outside -2 to 2 if the pitch can not be spelled with the shifted letter.
+    """
+    shiftedNumber = (number + direction * intervalSize) % 12
+    shiftedLetter = (letter + direction * (degree - 1)) % 7 # Compound degrees wrap as well
+    accidental = (shiftedNumber - _LETTER_NUMS[shiftedLetter] + 6) % 12 - 6 # Nearest way round, -6 to 5
+    return (shiftedNumber, shiftedLetter, accidental)
+
+
+@lru_cache(maxsize=None) # Unbounded, callers must pass a valid spelling, interval and direction to keep it small
+def _shift_codes(letter: int, accidental: int, intervalSize: int, degree: int, direction: int) -> tuple:
+    # Letter index and accidental value of a shifted pitch, as returned by "GenericPitch.shift".
+    # With valid arguments there are at most 35 spellings * 2 directions keys per interval.
+    pitchNumber, shiftedLetter, shiftedAccidental = _shift_kernel((_LETTER_NUMS[letter] + accidental) % 12, letter,
+                                                                  intervalSize, degree, direction)
+    if(-2 <= shiftedAccidental <= 2):
+        return (shiftedLetter, shiftedAccidental)
+
+    # enharmonic if no found
+    return _enharmonic_codes(pitchNumber, direction)
+
+
+def _enharmonic_codes(pitchNumber: int, direction: int) -> tuple:
+    # Letter index and accidental value of the spelling used when a shifted pitch needs more than a double accidental,
+    # the first name as in "PITCHES" when raising and the second one when lowering
+    pitchNames = _NAMES_BY_NUM[pitchNumber]
+    return _codes_of(pitchNames[min((1 - direction) >> 1, len(pitchNames) - 1)])
+
+
+@lru_cache(maxsize=None) # Only valid names are cached, a few dozen keys
+def _codes_of(pitch: str) -> tuple:
+    # Letter index and accidental value of a pitch name, as set by "GenericPitch.set_pitch"
+    pitchName = GenericPitch.res_name(pitch)
+    return (_LETTER_INDEX[pitchName[0]], _ACC_NUM[pitchName[1]])
 
 
 class GenericPitch:
@@ -115,6 +193,8 @@ class GenericPitch:
             e. g. "C - M3 = Ab"
 
     Static Methods:
+        shift_many(letters, accidentals, interval, direction): Shift many pitches given as letter indexes and accidental values.
+            e. g. [1, 3], [1, 1] (Ds, Fs) for [5, 0], [0, 0] (A, C) raised with A4.
         res_name(pitchName): Resolve the pitch name with accidental to a tuple and check the format.
             e. g. ["A", "s"] for "As".
         num_by_name(pitchName): Search pitch number by pitch name.
@@ -125,17 +205,19 @@ class GenericPitch:
             e. g. "Bf" for 10.
     """
 
-    __name = 'C'
-    __accidental = 'n'
+    # _letter: Index of the natural pitch, "C-B" = 0-6
+    # _accidental: Value of the accidental, defined by Enum "ACCIDENTALS"
+    # _number: The pitch number, cached since it is read by every shift and interval evaluation
+    __slots__ = ('_letter', '_accidental', '_number')
 
     def __init__(self, pitch: Union[int, str]) -> None:
         self.set(pitch)
 
     def __str__(self):
-        return '{}{}'.format(self.__name, '' if self.__accidental == ACCIDENTALS.n.name else self.__accidental)
+        return _SPELLINGS[self._letter][self._accidental + 2]
 
     def __repr__(self):
-        return "GenericPitch:\n    name: {},\n    number: {}".format(str(self), self.number)
+        return f"GenericPitch:\n    name: {self},\n    number: {self.number}"
 
     def set_pitch(self, pitch: Union[int, str]) -> None:
         """
@@ -146,13 +228,13 @@ class GenericPitch:
             or pitch[str: pitch name, e. g. "C, Cs, Cf"]: The pitch name, using this kind of argument is recommonded.
         """
         if(isinstance(pitch, str)):
-            pitchName = GenericPitch.res_name(pitch)
-            self.__name = pitchName[0]
-            self.__accidental = pitchName[1]
+            self._set_codes(*_codes_of(pitch))
         elif(isinstance(pitch, int)):
-            pitchName = GenericPitch.res_name(GenericPitch.name_by_num(pitch))
-            self.__name = pitchName[0]
-            self.__accidental = pitchName[1]
+            if(not(0 <= pitch < 12)):
+                raise ValueError('Pitch number must be an integer between 0 and 11.')
+            self._set_codes(*_CODES_BY_NUM[pitch])
+        else:
+            raise TypeError('"pitch" must be a pitch number between 0 and 11 or a pitch name as format of members in the dictionary "PITCHES".')
 
     def set(self, pitch: Union[int, str]) -> None:
         """
@@ -180,21 +262,56 @@ class GenericPitch:
         """
         assert (direction == -1 or direction ==1), 'Direction must be -1 or 1.'
 
-        # calculate pitch number
-        pitchNumber = self.number + direction * interval.singleSize
-        pitchNumber = utils.constrain_by_cycle(pitchNumber, 0, 12)
+        return GenericPitch._from_codes(*_shift_codes(self._letter, self._accidental,
+                                                      interval.singleSize, interval.degree, direction))
 
-        # find possible pitch name
-        shiftedPitchName = ord(self.__name) + direction * (int(interval.singleName[1]) - 1)
-        shiftedPitchName = chr(utils.constrain_by_cycle(shiftedPitchName, 65, 8)) # ASCII 65-73 = A-G
+    @staticmethod
+    def shift_many(letters: Sequence[int], accidentals: Sequence[int],
+                   interval: interval.AbstractInterval, direction: int) -> Tuple[array, array]:
+        """
+        Shift many pitches with the same interval and direction at once, same as calling "shift" on each pitch.
 
-        pitchNames = GenericPitch.names_by_num(pitchNumber)
-        for pitchName in pitchNames:
-            if(shiftedPitchName == pitchName[0]):
-                return GenericPitch(pitchName)
+        Arguments:
+            letters[Sequence[int]]: The letter indexes of the pitches, "C-B" = 0-6.
+            accidentals[Sequence[int]]: The accidental values of the pitches, defined by Enum "ACCIDENTALS".
+            interval[AbstractInterval instance]: The interval to shift.
+            direction[int: -1 or 1]: The direction to shift, -1 indicates to lower the pitch while 1 indicates to raise the pitch.
 
-        # enharmonic if no found
-        return GenericPitch(pitchNames[int(1 - direction / 2)])
+        Return:
+            shifted[Tuple[array, array]]: Letter indexes and accidental values of the shifted pitches, as arrays of int8.
+
+        Example:
+            i = AbstractInterval('A4') # Augumented 4th
+            letters, accidentals = GenericPitch.shift_many([5, 0], [0, 0], i, 1) # A, C
+            print(list(letters), list(accidentals)) # Prints "[1, 3] [1, 1]", Ds, Fs
+        """
+        assert (direction == -1 or direction ==1), 'Direction must be -1 or 1.'
+
+        intervalSize = interval.singleSize
+        degree = interval.degree
+        shiftedLetters = array('b')
+        shiftedAccidentals = array('b')
+        for index, (letter, accidental) in enumerate(zip(letters, accidentals)):
+            if(not(0 <= letter < 7)):
+                raise ValueError(f'Letter index at {index} must be an integer between 0 and 6, got {letter}.')
+            if(not(-2 <= accidental <= 2)):
+                raise ValueError(f'Accidental value at {index} must be an integer between -2 and 2, got {accidental}.')
+            shiftedLetter, shiftedAccidental = _shift_codes(letter, accidental, intervalSize, degree, direction)
+            shiftedLetters.append(shiftedLetter)
+            shiftedAccidentals.append(shiftedAccidental)
+        return (shiftedLetters, shiftedAccidentals)
+
+    @classmethod
+    def _from_codes(cls, letter: int, accidental: int) -> GenericPitch:
+        # Trusted constructor for a valid letter index and accidental value, skips resolving and validation.
+        instance = object.__new__(cls)
+        instance._set_codes(letter, accidental)
+        return instance
+
+    def _set_codes(self, letter: int, accidental: int) -> None:
+        self._letter = letter
+        self._accidental = accidental
+        self._number = (_LETTER_NUMS[letter] + accidental) % 12
 
     @staticmethod
     def res_name(pitchName: str) -> tuple:
@@ -207,17 +324,16 @@ class GenericPitch:
         Return:
             resolvedName[tuple]: Resolved name e. g. ["A", "s"].
         """
+        if(pitchName in _PITCH_NUM): # Natural pitch without accidental, the most common case
+            return (pitchName, _NATURAL)
+
         # check argument
-        if(pitchName[0] in NATURAL_PITCHES.__members__):
-            name = pitchName[0]
-        else:
+        name = pitchName[:1]
+        if(name not in _PITCH_NUM):
             raise ValueError('Pitch name must be one of "C", "D", "E", "F", "G", "A", "B".')
 
-        if(len(pitchName) == 1):
-            accidental = ACCIDENTALS.n.name
-        elif(pitchName[1:] in ACCIDENTALS.__members__):
-            accidental = pitchName[1:]
-        else:
+        accidental = _ACC_SUFFIX.get(pitchName[1:])
+        if(accidental is None):
             raise ValueError('The accidental of pitch name must be one of "s", "f", "ds", "df", or "n".')
 
         return (name, accidental)
@@ -233,11 +349,10 @@ class GenericPitch:
         Return:
             pitchNum[int]: The pitch number e. g. 10 for As.
         """
-        pitchName = GenericPitch.res_name(pitchName)
-        return (NATURAL_PITCHES[pitchName[0]].value + ACCIDENTALS[pitchName[1]].value) % 12
+        return _NUM_BY_RESOLVED[GenericPitch.res_name(pitchName)]
 
     @staticmethod
-    def names_by_num(num: int) -> List:
+    def names_by_num(num: int) -> Tuple[str, ...]:
         """
         Search pitch names by pitch number.
 
@@ -245,19 +360,13 @@ class GenericPitch:
             num[int: 0-11]: The pitch number, from 0 to 11.
 
         Return:
-            names[List:[int]]: The pitch names e. g. "As", "Bf" for 10.
+            names[Tuple[str]]: The pitch names e. g. "As", "Bf" for 10.
         """
         # check argument
         if(not(0 <= num < 12)):
             raise ValueError('Pitch number must be an integer between 0 and 11.')
 
-        names = []
-        try:
-            names.apppend(NATURAL_PITCHES(num).name, ACCIDENTALS.n.name)
-        except:
-            names = utils.search_dict_by_value(PITCHES, num)
-
-        return names
+        return _NAMES_BY_NUM[num]
 
     @staticmethod
     def name_by_num(num: int) -> str:
@@ -273,10 +382,7 @@ class GenericPitch:
         if(not(0 <= num < 12)):
             raise ValueError('Pitch number must be an integer between 0 and 11.')
 
-        try:
-            return "{}".format(NATURAL_PITCHES(num).name)
-        except:
-            return "{}f".format(NATURAL_PITCHES(num + 1).name)
+        return _NAME_BY_NUM[num]
 
 
     def __add__(self, interval: AbstractInterval) -> GenericPitch:
@@ -308,19 +414,19 @@ class GenericPitch:
 
     @property
     def name(self):
-        return self.__name
+        return _LETTER_NAMES[self._letter]
 
     @property
     def accidental(self):
-        return self.__accidental
+        return _ACC_NAMES[self._accidental + 2]
     
     @property
     def number(self):
-        return (NATURAL_PITCHES[self.__name].value + ACCIDENTALS[self.__accidental].value) % 12
+        return self._number
 
     @property
     def scaleDegree(self):
-        return NATURAL_SCALE[self.__name].value
+        return self._letter + 1
     
 
 class Pitch(GenericPitch):
@@ -358,32 +464,31 @@ class Pitch(GenericPitch):
             e. g. "C4" for 60.
     """
 
-    __octave = 4
+    __slots__ = ('_octave',)
 
     def __init__(self, pitch: Union[int, str]) -> None:
         self.set(pitch)
 
     def __str__(self):
-        return '{}{}{}'.format(self.__name, '' if self.__accidental == ACCIDENTALS.n.name else self.__accidental,
-                                self.__octave)
+        return f"{_SPELLINGS[self._letter][self._accidental + 2]}{self._octave}"
 
     def __repr__(self):
-        return "Pitch:\n    name: {},\n    number: {},\n    octave: {}".format(str(self), self.number, self.octave)
+        return f"Pitch:\n    name: {self},\n    number: {self.number},\n    octave: {self._octave}"
 
     def set(self, pitch: Union[int, str]) -> None:
         if(isinstance(pitch, str)):
             pitchName = Pitch.res_name(pitch)
-            self.__name = pitchName[0]
-            self.__accidental = pitchName[1]
-            self.__octave = pitchName[2]
+            self._set_codes(_LETTER_INDEX[pitchName[0]], _ACC_NUM[pitchName[1]])
+            self._octave = pitchName[2]
         elif(isinstance(pitch, int)):
             pitchName = Pitch.res_name(Pitch.name_by_MIDI_num(pitch))
-            self.__name = pitchName[0]
-            self.__accidental = pitchName[1]
-            self.__octave = pitchName[2]
+            self._set_codes(_LETTER_INDEX[pitchName[0]], _ACC_NUM[pitchName[1]])
+            self._octave = pitchName[2]
+        else:
+            raise TypeError('"pitch" must be a MIDI number or a pitch name with octave, e. g. "C4".')
 
     def set_pitch(self, pitch: Union[int, str]) -> None:
-        if(self.__octave == 8):
+        if(self._octave == 8):
             if(GenericPitch.num_by_name(pitch) > 0):
                 raise ValueError("The pitch is out of range, should between A0 and C8")
 
@@ -395,7 +500,7 @@ class Pitch(GenericPitch):
         elif(octave == 8 and self.number > 0):
             raise ValueError("The pitch is out of range, should between A0 and C8")
         else:
-            self.__octave = octave
+            self._octave = octave
 
     def shift(self, interval: interval.GenericInterval, direction: int) -> Pitch:
         pass # TODO
@@ -416,7 +521,7 @@ class Pitch(GenericPitch):
 
         if(octave < 0 or octave > 8):
             raise ValueError("Octave number out of range, should between 0 and 8.")
-        elif(octave == 8 and GenericPitch.num_by_name(pitchName[:-1]) > 0):
+        elif(octave == 8 and _NUM_BY_RESOLVED[genericPitch] > 0):
             raise ValueError("The pitch is out of range, should between A0 and C8")
         else:
             return (genericPitch[0], genericPitch[1], octave)
@@ -425,7 +530,7 @@ class Pitch(GenericPitch):
     def name_by_MIDI_num(MIDINum: int) -> str:
         pitchName = GenericPitch.name_by_num(MIDINum % 12)
         octave = MIDINum // 12 - 1
-        return "{}{}".format(pitchName, octave)
+        return f"{pitchName}{octave}"
 
     @staticmethod
     def names_by_MIDI_num(MIDINum: int) -> str:
@@ -434,13 +539,13 @@ class Pitch(GenericPitch):
     @staticmethod
     def MIDI_num_by_name(pitchName: str) -> int:
         pitch = Pitch.res_name(pitchName)
-        return GenericPitch.num_by_name("{}{}".format(pitch[0], pitch[1])) + 12 * (pitch[2] + 1)
+        return _NUM_BY_RESOLVED[(pitch[0], pitch[1])] + 12 * (pitch[2] + 1)
 
     @property
     def octave(self):
-        return self.__octave
+        return self._octave
     
     @property
     def MIDInumber(self):
-        return Pitch.name_by_MIDI_num(str(self))
+        return self._number + 12 * (self._octave + 1)
     
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""                                                                                  """
+"""          ██████╗ ██╗████████╗ ██████╗██╗  ██╗███████╗███████╗████████╗           """
+"""          ██╔══██╗██║╚══██╔══╝██╔════╝██║  ██║██╔════╝██╔════╝╚══██╔══╝           """
+"""          ██████╔╝██║   ██║   ██║     ███████║███████╗█████╗     ██║              """
+"""          ██╔═══╝ ██║   ██║   ██║     ██╔══██║╚════██║██╔══╝     ██║              """
+"""          ██║     ██║   ██║   ╚██████╗██║  ██║███████║███████╗   ██║              """
+"""          ╚═╝     ╚═╝   ╚═╝    ╚═════╝╚═╝  ╚═╝╚══════╝╚══════╝   ╚═╝              """
+"""                                                                                  """
+""" Module Name: pitchset                                                            """
+""" Author: agent("agent@local")                                                     """
+""" Last modified: 2026-10-15                                                        """
+"""                                                                                  """
+""" Description: Pitch class sets as 12-bit integers, bit "i" is set when pitch      """
+"""              number "i" is in the set, e. g. 145 for {C, E, G}. Union,           """
+"""              intersection and subset tests are "|", "&" and "(a & b) == b".      """
+"""                                                                                  """
+""" Exported methods:                                                                """
+"""     from_pitches(pitches), transpose(pitchSet, semitones), to_pitches(pitchSet)  """
+"""                                                                                  """
+
+from typing import Union, List, Iterable
+import pitch
+
+# Pitch class set containing all 12 pitches
+_FULL = 0xFFF
+
+
+def from_pitches(pitches: Iterable[Union[pitch.GenericPitch, int]]) -> int:
+    """
+    Build a pitch class set from pitches.
+
+    Arguments:
+        pitches[Iterable[GenericPitch or int: 0-11]]: The pitches, or their pitch numbers.
+
+    Return:
+        pitchSet[int]: The pitch class set.
+
+    Example:
+        s = from_pitches([GenericPitch("C"), GenericPitch("E"), GenericPitch("G")])
+        print(s) # Prints "145"
+    """
+    pitchSet = 0
+    for p in pitches:
+        if(isinstance(p, pitch.GenericPitch)):
+            number = p.number
+        elif(isinstance(p, int) and not isinstance(p, bool)):
+            number = p
+        else:
+            raise TypeError('Pitches must be "GenericPitch" instances or pitch numbers between 0 and 11.')
+        if(not(0 <= number < 12)):
+            raise ValueError("Pitch number must be an integer between 0 and 11.")
+        pitchSet |= 1 << number
+    return pitchSet
+
+
+def transpose(pitchSet: int, semitones: int) -> int:
+    """
+    Transpose a pitch class set, rotating it by semitones.
+
+    Arguments:
+        pitchSet[int]: The pitch class set, bits above the 12 pitches are ignored as in "to_pitches".
+        semitones[int]: The semitones to transpose, negative to lower the pitches.
+
+    Return:
+        pitchSet[int]: The transposed pitch class set.
+
+    Example:
+        print(transpose(145, 2)) # Prints "580", D major triad {D, Fs, A}
+    """
+    pitchSet &= _FULL
+    semitones %= 12
+    return ((pitchSet << semitones) | (pitchSet >> (12 - semitones))) & _FULL
+
+
+def to_pitches(pitchSet: int) -> List[pitch.GenericPitch]:
+    """
+    List pitches of a pitch class set from low to high, natural and flat names are prior.
+
+    Arguments:
+        pitchSet[int]: The pitch class set.
+
+    Return:
+        pitches[List[GenericPitch]]: The pitches in the set.
+
+    Example:
+        print([str(p) for p in to_pitches(580)]) # Prints "['D', 'Gf', 'A']"
+    """
+    pitches = []
+    pitchSet &= _FULL
+    while(pitchSet):
+        lowest = pitchSet & -pitchSet
+        pitches.append(pitch.GenericPitch(lowest.bit_length() - 1))
+        pitchSet ^= lowest
+    return pitches
@@ -15,11 +15,19 @@
 """ Importing: from utils import *                                                   """
 """                                                                                  """
 """ Exported methods:                                                                """
-"""     search_dict_by_value(dict, val)                                              """
+"""     search_dict_by_value(dict, val), reverse_dict(dict)                          """
 
 def search_dict_by_value(dict, val):
+    # Scans the whole dictionary, use "reverse_dict" once instead for repeated searches
     return [key for key, value in dict.items() if value == val]
 
+def reverse_dict(dict):
+    # Keys of the dictionary grouped by value, in the order of the dictionary
+    reversed = {}
+    for key, value in dict.items():
+        reversed.setdefault(value, []).append(key)
+    return reversed
+
 def constrain(val, thrL, thrH):
     if(val < thrL):
         return thrL
@@ -29,7 +37,5 @@ def constrain(val, thrL, thrH):
         return val
 
 def constrain_by_cycle(val, pha, cyc):
-    if(pha <= val <= (pha + cyc)):
-        return val
-    else:
-        return (val % cyc - pha % cyc) + pha
\ No newline at end of file
+    # Python modulo is non-negative for a positive cycle, the result is always in [pha, pha + cyc)
+    return (val - pha) % cyc + pha
\ No newline at end of file